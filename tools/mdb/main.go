@@ -2,8 +2,10 @@ package main
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
 	"fmt"
+	"io"
 	"math"
 	"net"
 	"net/url"
@@ -11,6 +13,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"sort"
+	"sync"
 	"strconv"
 	"strings"
 	"time"
@@ -25,6 +28,12 @@ import (
 	"github.com/minio/pkg/v3/console"
 )
 
+// Byte-size units for space reporting
+const (
+	GiB = int64(1) << 30
+	TiB = int64(1) << 40
+)
+
 // Version information - set at build time via ldflags
 var (
 	Version   = "dev"
@@ -32,8 +41,9 @@ var (
 	BuildDate = "unknown"
 )
 
-// ANSI color codes
-const (
+// ANSI color codes; cleared at startup when stdout is not a terminal so
+// piped/redirected output stays plain (set MDB_FORCE_COLOR=1 to override)
+var (
 	Green  = "\033[92m"
 	Red    = "\033[91m"
 	Yellow = "\033[93m"
@@ -42,6 +52,86 @@ const (
 	Reset  = "\033[0m"
 )
 
+// Pre-rendered table cells for values drawn from a tiny key space, so row
+// loops do a lookup instead of rebuilding the same colored string per drive
+var (
+	stateOkCell       string
+	scanningYesCell   string
+	scanningNoCell    string
+	localYesCell      string
+	localNoCell       string
+	serverOnlineCell  string
+	serverOfflineCell string
+)
+
+func init() {
+	if os.Getenv("MDB_FORCE_COLOR") != "1" {
+		if fi, err := os.Stdout.Stat(); err == nil && fi.Mode()&os.ModeCharDevice == 0 {
+			Green, Red, Yellow, Blue, Bold, Reset = "", "", "", "", "", ""
+		}
+	}
+	stateOkCell = Green + "ok" + Reset
+	scanningYesCell = Yellow + "Yes" + Reset
+	scanningNoCell = Green + "No" + Reset
+	localYesCell = Green + "Yes" + Reset
+	localNoCell = Yellow + "No" + Reset
+	serverOnlineCell = Green + "online" + Reset
+	serverOfflineCell = Red + "offline" + Reset
+}
+
+// usedPctColor returns the color for a "percent used" value (higher is worse)
+func usedPctColor(pct float64) string {
+	if pct >= 95 {
+		return Red
+	}
+	if pct >= 80 {
+		return Yellow
+	}
+	return Green
+}
+
+// blueIndexCell memoizes the colored pool/set index cells; the same handful
+// of small indices repeat across every table row
+var blueIndexCells = make(map[int]string)
+
+func blueIndexCell(n int) string {
+	if cell, ok := blueIndexCells[n]; ok {
+		return cell
+	}
+	cell := Blue + strconv.Itoa(n) + Reset
+	blueIndexCells[n] = cell
+	return cell
+}
+
+// freePctColor returns the color for a "percent free" value (lower is worse)
+func freePctColor(pct float64) string {
+	if pct <= 5 {
+		return Red
+	}
+	if pct <= 20 {
+		return Yellow
+	}
+	return Green
+}
+
+// pctCellCache memoizes the rendered percentage cells; values quantize to
+// one decimal place, so a cluster's worth of drives collapses to a handful
+// of distinct strings
+var pctCellCache = make(map[string]string)
+
+// pctCell renders pct as a colored "NN.N%" cell, reusing a cached copy when
+// the same color/value pair has been rendered before
+func pctCell(color string, pct float64) string {
+	s := strconv.FormatFloat(pct, 'f', 1, 64)
+	key := color + s
+	if cell, ok := pctCellCache[key]; ok {
+		return cell
+	}
+	cell := color + s + "%" + Reset
+	pctCellCache[key] = cell
+	return cell
+}
+
 // clusterStruct wraps Info message together with fields "Status" and "Error"
 type clusterStruct struct {
 	Status string             `json:"status"`
@@ -69,9 +159,10 @@ type DiskInfo struct {
 	Server         string
 	Path           string
 	State          string
+	StateOK        bool
 	UUID           string
 	Scanning       bool
-	DiskIndex      interface{}
+	DiskIndex      int
 	TotalSpace     int64
 	UsedSpace      int64
 	AvailableSpace int64
@@ -89,7 +180,6 @@ type DiskInfo struct {
 type ErasureSetInfo struct {
 	PoolIdx          int
 	SetIdx           int
-	Drives           []DiskInfo
 	AvgSpaceUsedPct  float64
 	AvgFreeSpacePct  float64
 	AvgInodesUsedPct float64
@@ -98,6 +188,29 @@ type ErasureSetInfo struct {
 	Scanning         int
 }
 
+// poolSet identifies one erasure set within one pool; it keys the per-set
+// drive lists and aggregates so no string formatting or re-parsing of
+// indexes is needed on lookups
+type poolSet struct {
+	Pool int
+	Set  int
+}
+
+// setAggregate holds running totals for a single erasure set, accumulated
+// in the same pass over the drives that builds the drive maps. Downstream
+// consumers read these instead of re-walking every drive.
+type setAggregate struct {
+	Count      int
+	Good       int
+	Bad        int
+	Scanning   int
+	TotalSpace int64
+	UsedSpace  int64
+	AvailSpace int64
+	UsedInodes int64
+	FreeInodes int64
+}
+
 // ClusterStats holds cluster-wide statistics
 type ClusterStats struct {
 	TotalDisks    int
@@ -114,27 +227,45 @@ type ClusterStats struct {
 type Pager struct {
 	enabled bool
 	buffer  *strings.Builder
+	out     *bufio.Writer
+	w       io.Writer
 }
 
 func NewPager(enabled bool) *Pager {
-	return &Pager{
-		enabled: enabled,
-		buffer:  &strings.Builder{},
+	p := &Pager{enabled: enabled}
+	if enabled {
+		p.buffer = &strings.Builder{}
+		// Seed the capture buffer to match the direct path's write buffer;
+		// table output reaches this size quickly and early small appends
+		// would otherwise trigger a cascade of grow-and-copy steps
+		p.buffer.Grow(64 * 1024)
+		p.w = p.buffer
+	} else {
+		// Batch direct output through one buffered writer instead of a
+		// write syscall per Printf; Show flushes it once at the end
+		p.out = bufio.NewWriterSize(os.Stdout, 64*1024)
+		p.w = p.out
 	}
+	return p
 }
 
 func (p *Pager) Printf(format string, args ...interface{}) {
-	text := fmt.Sprintf(format, args...)
-	if p.enabled {
-		p.buffer.WriteString(text)
-	} else {
-		fmt.Printf(format, args...)
-	}
+	// Format straight into the destination picked at construction time;
+	// going through Sprintf first would allocate an intermediate string
+	fmt.Fprintf(p.w, format, args...)
 }
 
-// Show displays the buffered output using bubbletea viewport
+// WriteString emits an already-formatted string, skipping Printf's format
+// parsing for lines the table renderers have pre-assembled
+func (p *Pager) WriteString(s string) {
+	io.WriteString(p.w, s)
+}
+
+// Show displays the buffered output using bubbletea viewport,
+// or flushes the buffered writer when paging is disabled
 func (p *Pager) Show() {
 	if !p.enabled {
+		p.out.Flush()
 		return
 	}
 
@@ -600,23 +731,27 @@ func cmdConfigList(ctx *cli.Context) error {
 		ConfigInfo
 		DeploymentID string
 	}
-	configsWithID := make([]configWithDeploymentID, 0, len(configs))
-	
-	for _, cfg := range configs {
-		deploymentID := "N/A"
-		infoStruct, err := loadJSON(cfg.FilePath)
-		if err == nil && infoStruct != nil && infoStruct.Info.DeploymentID != "" {
-			deploymentID = infoStruct.Info.DeploymentID
-			// Truncate if too long
-			if len(deploymentID) > 36 {
-				deploymentID = deploymentID[:36] + "..."
+	configsWithID := make([]configWithDeploymentID, len(configs))
+	
+	// Each deployment ID comes from a separate dump file, so the reads are
+	// independent; load them concurrently and keep the listing order by
+	// writing each result into its own slot
+	var wg sync.WaitGroup
+	for i, cfg := range configs {
+		configsWithID[i] = configWithDeploymentID{ConfigInfo: cfg, DeploymentID: "N/A"}
+		wg.Add(1)
+		go func(i int, filePath string) {
+			defer wg.Done()
+			if id := loadDeploymentID(filePath); id != "" {
+				// Truncate if too long
+				if len(id) > 36 {
+					id = id[:36] + "..."
+				}
+				configsWithID[i].DeploymentID = id
 			}
-		}
-		configsWithID = append(configsWithID, configWithDeploymentID{
-			ConfigInfo:   cfg,
-			DeploymentID: deploymentID,
-		})
+		}(i, cfg.FilePath)
 	}
+	wg.Wait()
 	
 	fmt.Printf("%-20s %-38s %-60s %s\n", "NAME", "DEPLOYMENT ID", "FILE", "CREATED")
 	fmt.Println(strings.Repeat("-", 150))
@@ -703,7 +838,6 @@ func processAndDisplay(config *Config) error {
 	}
 
 	servers := infoStruct.Info.Servers
-	pools := extractPoolsFromServers(servers)
 	parityDisks := int(infoStruct.Info.Backend.StandardSCParity)
 	if parityDisks == 0 {
 		parityDisks = 2 // Default to EC-2
@@ -714,19 +848,100 @@ func processAndDisplay(config *Config) error {
 	pager.Printf("%sDetected Erasure Coding Configuration: EC:%d%s\n", Bold, parityDisks, Reset)
 	pager.Printf("\n")
 
-	poolSetDrives := make(map[string][]DiskInfo)
-	allPoolSetDrives := make(map[string][]DiskInfo) // For capacity calculations (all drives)
+	allPoolSetDrives := make(map[poolSet][]DiskInfo) // For capacity calculations (all drives)
+	setStats := make(map[poolSet]*setAggregate)      // Per-set totals over all drives
+	pools := make(map[int]map[int]struct{})          // Pool/set layout, built during the drive pass
 	stats := ClusterStats{ParityDisks: parityDisks}
 
+	// Display filters only apply to the disks/sets views; without them the
+	// display map would hold exactly the same drives as allPoolSetDrives,
+	// so share the map instead of storing every drive twice
+	filtersActive := (config.ShowDisks || config.ShowSets) && (config.ScanningMode || config.FailedMode)
+	poolSetDrives := allPoolSetDrives
+	if filtersActive {
+		poolSetDrives = make(map[poolSet][]DiskInfo)
+	}
+
+	// Resolve the filter mode once instead of consulting config fields on
+	// every drive
+	scanningOnly := filtersActive && config.ScanningMode
+	failedOnly := filtersActive && config.FailedMode
+
+	// The summary and servers views only consume the aggregated stats, so
+	// skip retaining per-drive copies entirely when no disks/sets view
+	// will read them
+	collectDrives := config.ShowDisks || config.ShowSets
+
+	// When a display filter is active the unfiltered copies are only read
+	// by the combined failed+scanning counting path in the sets view; in
+	// plain failed mode on a healthy cluster they would be built for every
+	// drive and never looked at again
+	collectAll := collectDrives &&
+		(!filtersActive || (config.ShowSets && config.ScanningMode && config.FailedMode))
+
 	// Process all drives
 	for _, server := range servers {
+		// The summary/servers-only path reads nothing but the aggregated
+		// counters, so feed them straight from the raw disk records and
+		// skip building DiskInfo values (domain trimming, path extraction,
+		// percentage math) for drives nothing will display
+		if !collectDrives {
+			for i := range server.Disks {
+				disk := &server.Disks[i]
+				stats.TotalDisks++
+				if disk.Healing {
+					stats.ScanningDisks++
+				}
+				stateOK := disk.State == "ok"
+				if stateOK {
+					stats.OkDisks++
+				} else {
+					stats.BadDisks++
+				}
+				stats.TotalSpace += int64(disk.TotalSpace)
+				stats.UsedSpace += int64(disk.UsedSpace)
+
+				key := poolSet{disk.PoolIndex, disk.SetIndex}
+				sets := pools[disk.PoolIndex]
+				if sets == nil {
+					sets = make(map[int]struct{})
+					pools[disk.PoolIndex] = sets
+				}
+				sets[disk.SetIndex] = struct{}{}
+
+				agg := setStats[key]
+				if agg == nil {
+					agg = &setAggregate{}
+					setStats[key] = agg
+				}
+				agg.Count++
+				if stateOK {
+					agg.Good++
+				} else {
+					agg.Bad++
+				}
+				if disk.Healing {
+					agg.Scanning++
+				}
+				agg.TotalSpace += int64(disk.TotalSpace)
+				agg.UsedSpace += int64(disk.UsedSpace)
+				agg.AvailSpace += int64(disk.AvailableSpace)
+				agg.UsedInodes += int64(disk.UsedInodes)
+				agg.FreeInodes += int64(disk.FreeInodes)
+			}
+			continue
+		}
+
 		drives := getDrives(server, config.TrimDomain)
-		for _, drive := range drives {
+		// Iterate by index so each pass reads the DiskInfo in place instead
+		// of copying the whole struct per iteration
+		for i := range drives {
+			drive := &drives[i]
 			stats.TotalDisks++
 			if drive.Scanning {
 				stats.ScanningDisks++
 			}
-			if drive.State == "ok" {
+			if drive.StateOK {
 				stats.OkDisks++
 			} else {
 				stats.BadDisks++
@@ -734,21 +949,52 @@ func processAndDisplay(config *Config) error {
 			stats.TotalSpace += drive.TotalSpace
 			stats.UsedSpace += drive.UsedSpace
 
-			// Store all drives for capacity calculations
-			key := fmt.Sprintf("%d:%d", drive.PoolIndex, drive.SetIndex)
-			allPoolSetDrives[key] = append(allPoolSetDrives[key], drive)
+			key := poolSet{drive.PoolIndex, drive.SetIndex}
+
+			// Record the pool/set layout here rather than walking every
+			// disk a second time up front
+			sets := pools[drive.PoolIndex]
+			if sets == nil {
+				sets = make(map[int]struct{})
+				pools[drive.PoolIndex] = sets
+			}
+			sets[drive.SetIndex] = struct{}{}
+
+			if collectAll {
+				allPoolSetDrives[key] = append(allPoolSetDrives[key], *drive)
+			}
+
+			// Accumulate per-set totals in the same pass
+			agg := setStats[key]
+			if agg == nil {
+				agg = &setAggregate{}
+				setStats[key] = agg
+			}
+			agg.Count++
+			if drive.StateOK {
+				agg.Good++
+			} else {
+				agg.Bad++
+			}
+			if drive.Scanning {
+				agg.Scanning++
+			}
+			agg.TotalSpace += drive.TotalSpace
+			agg.UsedSpace += drive.UsedSpace
+			agg.AvailSpace += drive.AvailableSpace
+			agg.UsedInodes += drive.UsedInodes
+			agg.FreeInodes += drive.FreeInodes
 
 			// Apply filters for display (only for disks/sets views)
-			if config.ShowDisks || config.ShowSets {
-				if config.ScanningMode && !drive.Scanning {
+			if filtersActive {
+				if scanningOnly && !drive.Scanning {
 					continue
 				}
-				if config.FailedMode && drive.State == "ok" {
+				if failedOnly && drive.StateOK {
 					continue
 				}
+				poolSetDrives[key] = append(poolSetDrives[key], *drive)
 			}
-
-			poolSetDrives[key] = append(poolSetDrives[key], drive)
 		}
 	}
 
@@ -756,7 +1002,7 @@ func processAndDisplay(config *Config) error {
 
 	// Print summary if requested
 	if config.ShowSummary {
-		printClusterSummary(pager, stats, pools, allPoolSetDrives, servers, infoStruct, config)
+		printClusterSummary(pager, stats, pools, setStats, servers, infoStruct, config)
 	}
 
 	// Print servers if requested
@@ -784,14 +1030,14 @@ func processAndDisplay(config *Config) error {
 	}
 
 	if config.ShowSets && config.LowSpaceThreshold != nil {
-		printLowSpaceErasureSets(pager, pools, poolSetDrives, *config.LowSpaceThreshold, config)
+		printLowSpaceErasureSets(pager, pools, poolSetDrives, setStats, *config.LowSpaceThreshold, config)
 		pager.Show()
 		return nil
 	}
 
 	// Print sets/disks if requested
 	if config.ShowSets || config.ShowDisks {
-		printPoolsAndSets(pager, pools, poolSetDrives, allPoolSetDrives, config, servers)
+		printPoolsAndSets(pager, pools, poolSetDrives, allPoolSetDrives, setStats, config, servers)
 	}
 	
 	// Show the pager if enabled
@@ -850,26 +1096,30 @@ func cmdShowServers(ctx *cli.Context) error {
 func parseShowFlags(ctx *cli.Context, showSummary, showServers, showSets, showDisks bool) (*Config, error) {
 	config := &Config{}
 	
-	// Load JSON file from current config - reload configsData fresh each time
-	currentName, err := getCurrentConfig()
-	if err != nil {
-		return nil, err
-	}
-	
-	// Double-check that we have the right current config by reloading
+	// Resolve the JSON file from the current config with a single read of
+	// the configs file; getCurrentConfig and loadConfig would each reload
+	// and re-parse the same data
 	configsData, err := loadConfigsData()
 	if err != nil {
 		return nil, fmt.Errorf("failed to load configs data: %v", err)
 	}
-	
-	if configsData.CurrentConfig != currentName {
-		// Current config changed, use the one from configsData
-		currentName = configsData.CurrentConfig
+	currentName := configsData.CurrentConfig
+	if currentName == "" {
+		return nil, fmt.Errorf("no current config set. Use 'mdb config add <name> <file.json>' to add a config")
 	}
-	
-	jsonFile, err := loadConfig(currentName)
-	if err != nil {
-		return nil, fmt.Errorf("failed to load config '%s': %v", currentName, err)
+	jsonFile := ""
+	for _, cfg := range configsData.Configs {
+		if cfg.Name == currentName {
+			// Validate that the file still exists
+			if _, err := os.Stat(cfg.FilePath); os.IsNotExist(err) {
+				return nil, fmt.Errorf("failed to load config '%s': config '%s' file '%s' does not exist", currentName, currentName, cfg.FilePath)
+			}
+			jsonFile = cfg.FilePath
+			break
+		}
+	}
+	if jsonFile == "" {
+		return nil, fmt.Errorf("failed to load config '%s': config '%s' not found", currentName, currentName)
 	}
 	config.JSONFile = jsonFile
 	
@@ -882,14 +1132,14 @@ func parseShowFlags(ctx *cli.Context, showSummary, showServers, showSets, showDi
 	config.FailedMode = ctx.Bool("failed")
 	config.TrimDomain = ctx.String("trim-domain")
 	
-	// Parse string flags that need conversion
-	if ctx.String("low-space") != "" {
-		if val, err := strconv.ParseFloat(ctx.String("low-space"), 64); err == nil {
+	// Parse string flags that need conversion; read each flag once
+	if lowSpace := ctx.String("low-space"); lowSpace != "" {
+		if val, err := strconv.ParseFloat(lowSpace, 64); err == nil {
 			config.LowSpaceThreshold = &val
 		}
 	}
-	if ctx.String("min-bad-disks") != "" {
-		if val, err := strconv.Atoi(ctx.String("min-bad-disks")); err == nil && val >= 0 {
+	if minBadDisks := ctx.String("min-bad-disks"); minBadDisks != "" {
+		if val, err := strconv.Atoi(minBadDisks); err == nil && val >= 0 {
 			config.MinBadDisks = &val
 		}
 	}
@@ -1156,38 +1406,53 @@ func removeConfig(name string) error {
 }
 
 func loadJSON(filename string) (*clusterStruct, error) {
-	file, err := os.Open(filename)
-	if err != nil {
-		return nil, fmt.Errorf("file '%s' not found: %v", filename, err)
-	}
-	defer file.Close()
-
 	data, err := os.ReadFile(filename)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read file '%s': %v", filename, err)
 	}
 
 	// Check for raw prefix and remove it (like stats does)
-	data = []byte(strings.Replace(string(data), `{"version":"3"}`, "", 1))
+	data = bytes.Replace(data, []byte(`{"version":"3"}`), nil, 1)
+
+	// NDJSON shape detector: "}\n{" cannot occur inside a single valid
+	// JSON document (raw newlines are illegal in strings), so seeing it
+	// near the start means concatenated records; skip the doomed
+	// full-document parse attempts in that case
+	window := data
+	if len(window) > 64*1024 {
+		window = window[:64*1024]
+	}
+	if bytes.Contains(window, []byte("}\n{")) {
+		return loadNDJSON(data)
+	}
+
+	// The subnet wrapper format nests everything under a "minio" key; if
+	// that key isn't even present, re-parsing the whole document against
+	// the wrapper struct can only fail, so skip it
+	hasMinioKey := bytes.Contains(data, []byte(`"minio"`))
 
 	infoStruct := clusterStruct{}
 	err = json.Unmarshal(data, &infoStruct)
 	if err != nil {
 		// Try with minio wrapper format
-		anotherFormat := struct {
-			InfoStruct clusterStruct `json:"minio"`
-		}{}
-		err = json.Unmarshal(data, &anotherFormat)
-		if err != nil {
-			// Try NDJSON format
-			return loadNDJSON(filename)
+		if hasMinioKey {
+			anotherFormat := struct {
+				InfoStruct clusterStruct `json:"minio"`
+			}{}
+			if err := json.Unmarshal(data, &anotherFormat); err == nil {
+				return &anotherFormat.InfoStruct, nil
+			}
 		}
-		return &anotherFormat.InfoStruct, nil
+		// Try NDJSON format
+		return loadNDJSON(data)
 	}
 
 	// If there is no server found on the first try, trying with different format
 	// data could be from subnet diagnostics page
 	if len(infoStruct.Info.Servers) == 0 {
+		if !hasMinioKey {
+			return nil, fmt.Errorf("failed to unmarshal JSON: no servers found")
+		}
 		anotherFormat := struct {
 			InfoStruct clusterStruct `json:"minio"`
 		}{}
@@ -1201,17 +1466,68 @@ func loadJSON(filename string) (*clusterStruct, error) {
 	return &infoStruct, nil
 }
 
-func loadNDJSON(filename string) (*clusterStruct, error) {
-	file, err := os.Open(filename)
+// loadDeploymentID extracts just the deployment ID from a diagnostics dump.
+// The config list only shows this one field, so decoding the whole document
+// (servers, drives, metrics) per config would be wasted work; a tiny target
+// struct lets encoding/json skip past everything else.
+func loadDeploymentID(filename string) string {
+	data, err := os.ReadFile(filename)
 	if err != nil {
-		return nil, err
+		return ""
+	}
+	data = bytes.Replace(data, []byte(`{"version":"3"}`), nil, 1)
+
+	type idStruct struct {
+		Info struct {
+			DeploymentID string `json:"deploymentID"`
+		} `json:"info"`
+	}
+	var record struct {
+		idStruct
+		Minio idStruct `json:"minio"`
+	}
+	if err := json.Unmarshal(data, &record); err == nil {
+		if record.Info.DeploymentID != "" {
+			return record.Info.DeploymentID
+		}
+		return record.Minio.Info.DeploymentID
+	}
+
+	// NDJSON dump: decode only lines that mention the field
+	idKey := []byte(`"deploymentID"`)
+	scanner := bufio.NewScanner(bytes.NewReader(data))
+	scanner.Buffer(make([]byte, 0, 64*1024), len(data)+1)
+	for scanner.Scan() {
+		line := scanner.Bytes()
+		if !bytes.Contains(line, idKey) {
+			continue
+		}
+		if err := json.Unmarshal(line, &record); err == nil {
+			if record.Info.DeploymentID != "" {
+				return record.Info.DeploymentID
+			}
+			if record.Minio.Info.DeploymentID != "" {
+				return record.Minio.Info.DeploymentID
+			}
+		}
 	}
-	defer file.Close()
+	return ""
+}
+
+func loadNDJSON(data []byte) (*clusterStruct, error) {
+	// Cheap byte prefilter: a line can only be useful if it carries server
+	// entries, so skip the JSON decoder entirely for lines that don't.
+	serversKey := []byte(`"servers"`)
+	minioKey := []byte(`"minio"`)
 
-	scanner := bufio.NewScanner(file)
+	scanner := bufio.NewScanner(bytes.NewReader(data))
+	// A single diagnostics line easily exceeds bufio.Scanner's 64KiB
+	// default token limit on large clusters; allocate the scan buffer once,
+	// bounded by the data we already hold
+	scanner.Buffer(make([]byte, 0, 64*1024), len(data)+1)
 	for scanner.Scan() {
 		line := scanner.Bytes()
-		if len(line) == 0 {
+		if len(line) == 0 || !bytes.Contains(line, serversKey) {
 			continue
 		}
 		var infoStruct clusterStruct
@@ -1220,7 +1536,10 @@ func loadNDJSON(filename string) (*clusterStruct, error) {
 				return &infoStruct, nil
 			}
 		}
-		// Try with minio wrapper
+		// Try with minio wrapper, but only if the wrapper key is present
+		if !bytes.Contains(line, minioKey) {
+			continue
+		}
 		anotherFormat := struct {
 			InfoStruct clusterStruct `json:"minio"`
 		}{}
@@ -1230,36 +1549,37 @@ func loadNDJSON(filename string) (*clusterStruct, error) {
 			}
 		}
 	}
-	return nil, fmt.Errorf("no valid JSON found")
-}
 
-func extractPoolsFromServers(servers []madmin.ServerProperties) map[string]map[string]interface{} {
-	pools := make(map[string]map[string]interface{})
-
-	// Build pools structure from drive information
-	for _, server := range servers {
-		for _, disk := range server.Disks {
-			poolIdx := disk.PoolIndex
-			setIdx := disk.SetIndex
-			poolKey := strconv.Itoa(poolIdx)
-			setKey := strconv.Itoa(setIdx)
-
-			if pools[poolKey] == nil {
-				pools[poolKey] = make(map[string]interface{})
-			}
-			if pools[poolKey][setKey] == nil {
-				pools[poolKey][setKey] = make(map[string]interface{})
-			}
+	// The line scan found nothing usable; records may be pretty-printed so
+	// a single value spans multiple lines. json.Decoder consumes a stream
+	// of concatenated JSON values natively, so walk the buffer that way and
+	// stop at the first record that carries servers.
+	dec := json.NewDecoder(bytes.NewReader(data))
+	for {
+		var record struct {
+			clusterStruct
+			Minio clusterStruct `json:"minio"`
+		}
+		if err := dec.Decode(&record); err != nil {
+			break
+		}
+		if len(record.Info.Servers) > 0 {
+			return &record.clusterStruct, nil
+		}
+		if len(record.Minio.Info.Servers) > 0 {
+			return &record.Minio, nil
 		}
 	}
-	return pools
+	return nil, fmt.Errorf("no valid JSON found")
 }
 
-func getErasureCodingConfig(servers []madmin.ServerProperties) int {
-	// Try to determine from backend info if available in infoStruct
-	// For now, use standardSCParity if available, otherwise default
-	// This will be set from infoStruct.Info.Backend.StandardSCParity in mainMDB
-	return 2 // Default to EC-2, will be updated if available from backend
+// displayUUID shortens a drive UUID to the form the table shows; nothing
+// downstream needs the full value, so the truncation happens once at load
+func displayUUID(uuid string) string {
+	if len(uuid) > 16 {
+		return uuid[:16] + "..."
+	}
+	return uuid
 }
 
 func getDrives(server madmin.ServerProperties, trimDomain string) []DiskInfo {
@@ -1271,9 +1591,10 @@ func getDrives(server madmin.ServerProperties, trimDomain string) []DiskInfo {
 			Server:         serverEndpoint,
 			Path:           disk.DrivePath,
 			State:          disk.State,
-			UUID:           disk.UUID,
+			StateOK:        disk.State == "ok",
+			UUID:           displayUUID(disk.UUID),
 			Scanning:       disk.Healing,
-			DiskIndex:      disk.DiskIndex,
+			DiskIndex:      diskIndexValue(disk.DiskIndex),
 			TotalSpace:     int64(disk.TotalSpace),
 			UsedSpace:      int64(disk.UsedSpace),
 			AvailableSpace: int64(disk.AvailableSpace),
@@ -1290,10 +1611,11 @@ func getDrives(server madmin.ServerProperties, trimDomain string) []DiskInfo {
 			diskInfo.Path = extractPathFromEndpoint(disk.Endpoint)
 		}
 
-		// Calculate percentages
+		// Calculate percentages; one division shared by both ratios
 		if diskInfo.TotalSpace > 0 {
-			diskInfo.FreeSpacePct = float64(diskInfo.AvailableSpace) / float64(diskInfo.TotalSpace) * 100
-			diskInfo.UsedSpacePct = float64(diskInfo.UsedSpace) / float64(diskInfo.TotalSpace) * 100
+			pctOfTotal := 100 / float64(diskInfo.TotalSpace)
+			diskInfo.FreeSpacePct = float64(diskInfo.AvailableSpace) * pctOfTotal
+			diskInfo.UsedSpacePct = float64(diskInfo.UsedSpace) * pctOfTotal
 		}
 
 		drives = append(drives, diskInfo)
@@ -1303,58 +1625,24 @@ func getDrives(server madmin.ServerProperties, trimDomain string) []DiskInfo {
 }
 
 func extractPathFromEndpoint(endpoint string) string {
-	if strings.Contains(endpoint, "/hadoop/") {
-		parts := strings.Split(endpoint, "/hadoop/")
-		if len(parts) > 1 {
-			return "/" + parts[1]
-		}
-	}
-	parts := strings.Split(endpoint, "/")
-	if len(parts) > 3 {
-		return "/" + strings.Join(parts[3:], "/")
-	}
-	return ""
-}
-
-func getString(m map[string]interface{}, key string, defaultValue string) string {
-	if val, ok := m[key].(string); ok {
-		return val
+	// strings.Cut scans once and allocates nothing, unlike Contains+Split
+	if _, after, found := strings.Cut(endpoint, "/hadoop/"); found {
+		return "/" + after
 	}
-	return defaultValue
-}
-
-func getInt(m map[string]interface{}, key string, defaultValue int) int {
-	switch v := m[key].(type) {
-	case float64:
-		return int(v)
-	case int:
-		return v
-	case int64:
-		return int(v)
-	}
-	return defaultValue
-}
-
-func getInt64(m map[string]interface{}, key string, defaultValue int64) int64 {
-	switch v := m[key].(type) {
-	case float64:
-		return int64(v)
-	case int:
-		return int64(v)
-	case int64:
-		return v
-	}
-	return defaultValue
-}
-
-func getBool(m map[string]interface{}, key string, defaultValue bool) bool {
-	if val, ok := m[key].(bool); ok {
-		return val
+	// Skip the first three '/'-separated segments (scheme://host) and keep
+	// the remainder as the drive path
+	rest := endpoint
+	for i := 0; i < 3; i++ {
+		_, after, found := strings.Cut(rest, "/")
+		if !found {
+			return ""
+		}
+		rest = after
 	}
-	return defaultValue
+	return "/" + rest
 }
 
-func printClusterSummary(pager *Pager, stats ClusterStats, pools map[string]map[string]interface{}, poolSetDrives map[string][]DiskInfo, servers []madmin.ServerProperties, infoStruct *clusterStruct, config *Config) {
+func printClusterSummary(pager *Pager, stats ClusterStats, pools map[int]map[int]struct{}, setStats map[poolSet]*setAggregate, servers []madmin.ServerProperties, infoStruct *clusterStruct, config *Config) {
 	pager.Printf("%sSummary%s\n", Bold, Reset)
 
 	if stats.DeploymentID != "" {
@@ -1391,41 +1679,27 @@ func printClusterSummary(pager *Pager, stats ClusterStats, pools map[string]map[
 	}
 
 	if stats.TotalSpace > 0 {
-		totalTB := float64(stats.TotalSpace) / (1024 * 1024 * 1024 * 1024)
-		usedTB := float64(stats.UsedSpace) / (1024 * 1024 * 1024 * 1024)
+		totalTB := float64(stats.TotalSpace) / float64(TiB)
+		usedTB := float64(stats.UsedSpace) / float64(TiB)
 
-		// Calculate usable capacity
+		// Calculate usable capacity from the per-set aggregates; setStats
+		// covers exactly the (pool, set) pairs seen in the drive pass, so
+		// iterate it directly instead of nested map lookups through pools
 		totalUsableSpace := int64(0)
-		for poolIdx, sets := range pools {
-			for setIdx := range sets {
-				key := fmt.Sprintf("%s:%s", poolIdx, setIdx)
-				drives := poolSetDrives[key]
-				totalDisksInSet := len(drives)
-				if totalDisksInSet > 0 {
-					if totalDisksInSet >= stats.ParityDisks {
-						dataDisks := totalDisksInSet - stats.ParityDisks
-						usableRatio := float64(dataDisks) / float64(totalDisksInSet)
-						for _, drive := range drives {
-							totalUsableSpace += int64(float64(drive.TotalSpace) * usableRatio)
-						}
-					}
-				}
+		for _, agg := range setStats {
+			if agg.Count >= stats.ParityDisks {
+				dataDisks := agg.Count - stats.ParityDisks
+				usableRatio := float64(dataDisks) / float64(agg.Count)
+				totalUsableSpace += int64(float64(agg.TotalSpace) * usableRatio)
 			}
 		}
 
-		usableTB := float64(totalUsableSpace) / (1024 * 1024 * 1024 * 1024)
+		usableTB := float64(totalUsableSpace) / float64(TiB)
 		usagePct := float64(stats.UsedSpace) / float64(totalUsableSpace) * 100
 		if totalUsableSpace == 0 {
 			usagePct = 0
 		}
-		var usageColor string
-		if usagePct < 80 {
-			usageColor = Green
-		} else if usagePct < 95 {
-			usageColor = Yellow
-		} else {
-			usageColor = Red
-		}
+		usageColor := usedPctColor(usagePct)
 
 		pager.Printf("  Raw Capacity: %.1f TB\n", totalTB)
 		pager.Printf("  Usable Capacity: %.1f TB\n", usableTB)
@@ -1453,14 +1727,17 @@ func printClusterSummary(pager *Pager, stats ClusterStats, pools map[string]map[
 	pager.Printf("\n")
 }
 
-func printFailedDisksTable(pager *Pager, poolSetDrives map[string][]DiskInfo, config *Config) {
-	allFailedDrives := make([]DiskInfo, 0)
+func printFailedDisksTable(pager *Pager, poolSetDrives map[poolSet][]DiskInfo, config *Config) {
+	// This table only renders in failed mode, where the main pass already
+	// filtered poolSetDrives down to failed drives; flatten the lists as-is
+	// into a slice sized up front instead of re-checking every state
+	total := 0
 	for _, drives := range poolSetDrives {
-		for _, drive := range drives {
-			if drive.State != "ok" {
-				allFailedDrives = append(allFailedDrives, drive)
-			}
-		}
+		total += len(drives)
+	}
+	allFailedDrives := make([]DiskInfo, 0, total)
+	for _, drives := range poolSetDrives {
+		allFailedDrives = append(allFailedDrives, drives...)
 	}
 
 	if len(allFailedDrives) == 0 {
@@ -1468,15 +1745,17 @@ func printFailedDisksTable(pager *Pager, poolSetDrives map[string][]DiskInfo, co
 		return
 	}
 
-	// Sort by pool, set, disk index
+	// Sort by pool, set, disk index using integer keys instead of
+	// re-formatting DiskIndex on every comparison
 	sort.Slice(allFailedDrives, func(i, j int) bool {
-		if allFailedDrives[i].PoolIndex != allFailedDrives[j].PoolIndex {
-			return allFailedDrives[i].PoolIndex < allFailedDrives[j].PoolIndex
+		a, b := &allFailedDrives[i], &allFailedDrives[j]
+		if a.PoolIndex != b.PoolIndex {
+			return a.PoolIndex < b.PoolIndex
 		}
-		if allFailedDrives[i].SetIndex != allFailedDrives[j].SetIndex {
-			return allFailedDrives[i].SetIndex < allFailedDrives[j].SetIndex
+		if a.SetIndex != b.SetIndex {
+			return a.SetIndex < b.SetIndex
 		}
-		return fmt.Sprintf("%v", allFailedDrives[i].DiskIndex) < fmt.Sprintf("%v", allFailedDrives[j].DiskIndex)
+		return a.DiskIndex < b.DiskIndex
 	})
 
 	pager.Printf("%sMinIO Failed/Faulty Disks from: %s%s\n", Bold, config.JSONFile, Reset)
@@ -1485,26 +1764,62 @@ func printFailedDisksTable(pager *Pager, poolSetDrives map[string][]DiskInfo, co
 	printTable(pager, allFailedDrives, config)
 }
 
-func printLowSpaceErasureSets(pager *Pager, pools map[string]map[string]interface{}, poolSetDrives map[string][]DiskInfo, threshold float64, config *Config) {
+func printLowSpaceErasureSets(pager *Pager, pools map[int]map[int]struct{}, poolSetDrives map[poolSet][]DiskInfo, setStats map[poolSet]*setAggregate, threshold float64, config *Config) {
 	erasureSets := make([]ErasureSetInfo, 0)
 
+	// Without a scanning/failed display filter, the per-set aggregates from
+	// the main drive pass hold exactly the sums needed here
+	useAggregates := !config.ScanningMode && !config.FailedMode
+
 	for poolIdx, sets := range pools {
 		for setIdx := range sets {
-			key := fmt.Sprintf("%s:%s", poolIdx, setIdx)
-			drives := poolSetDrives[key]
-			if len(drives) == 0 {
-				continue
-			}
+			key := poolSet{poolIdx, setIdx}
 
-			// Calculate averages
-			totalDrives := len(drives)
+			totalDrives := 0
 			avgTotalSpace := int64(0)
 			avgUsedSpace := int64(0)
 			avgFreeSpace := int64(0)
-			for _, d := range drives {
-				avgTotalSpace += d.TotalSpace
-				avgUsedSpace += d.UsedSpace
-				avgFreeSpace += d.AvailableSpace
+			usedInodes := int64(0)
+			freeInodes := int64(0)
+			good, bad, scanning := 0, 0, 0
+
+			if useAggregates {
+				agg := setStats[key]
+				if agg == nil || agg.Count == 0 {
+					continue
+				}
+				totalDrives = agg.Count
+				avgTotalSpace = agg.TotalSpace
+				avgUsedSpace = agg.UsedSpace
+				avgFreeSpace = agg.AvailSpace
+				usedInodes = agg.UsedInodes
+				freeInodes = agg.FreeInodes
+				good, bad, scanning = agg.Good, agg.Bad, agg.Scanning
+			} else {
+				drives := poolSetDrives[key]
+				if len(drives) == 0 {
+					continue
+				}
+
+				// Calculate averages and health counts in one pass over
+				// the drives
+				totalDrives = len(drives)
+				for i := range drives {
+					d := &drives[i]
+					avgTotalSpace += d.TotalSpace
+					avgUsedSpace += d.UsedSpace
+					avgFreeSpace += d.AvailableSpace
+					usedInodes += d.UsedInodes
+					freeInodes += d.FreeInodes
+					if d.StateOK {
+						good++
+					} else {
+						bad++
+					}
+					if d.Scanning {
+						scanning++
+					}
+				}
 			}
 			avgTotalSpace /= int64(totalDrives)
 			avgUsedSpace /= int64(totalDrives)
@@ -1517,18 +1832,20 @@ func printLowSpaceErasureSets(pager *Pager, pools map[string]map[string]interfac
 
 			// Only include erasure sets with free space below threshold
 			if avgFreeSpacePct < threshold {
-				poolIdxInt, _ := strconv.Atoi(poolIdx)
-				setIdxInt, _ := strconv.Atoi(setIdx)
 				es := ErasureSetInfo{
-					PoolIdx:         poolIdxInt,
-					SetIdx:          setIdxInt,
-					Drives:          drives,
+					PoolIdx:         poolIdx,
+					SetIdx:          setIdx,
 					AvgFreeSpacePct: avgFreeSpacePct,
-					AvgSpaceUsedPct: float64(avgUsedSpace) / float64(avgTotalSpace) * 100,
+					Good:            good,
+					Bad:             bad,
+					Scanning:        scanning,
 				}
 				if avgTotalSpace > 0 {
 					es.AvgSpaceUsedPct = float64(avgUsedSpace) / float64(avgTotalSpace) * 100
 				}
+				if totalInodes := usedInodes + freeInodes; totalInodes > 0 {
+					es.AvgInodesUsedPct = float64(usedInodes) / float64(totalInodes) * 100
+				}
 				erasureSets = append(erasureSets, es)
 			}
 		}
@@ -1547,75 +1864,33 @@ func printLowSpaceErasureSets(pager *Pager, pools map[string]map[string]interfac
 	pager.Printf("%sErasure Sets with Average Free Space < %.1f%% (sorted by utilization)%s\n", Bold, threshold, Reset)
 	pager.Printf("================================================================================\n")
 
+	// Accumulate the per-set lines and hand the pager one block
+	var out strings.Builder
 	for _, es := range erasureSets {
-		good := 0
-		bad := 0
-		scanning := 0
-		for _, d := range es.Drives {
-			if d.State == "ok" {
-				good++
-			} else {
-				bad++
-			}
-			if d.Scanning {
-				scanning++
-			}
+		goodText := fmt.Sprintf("%d", es.Good)
+		if es.Good > 0 {
+			goodText = fmt.Sprintf("%s%d%s", Green, es.Good, Reset)
 		}
-
-		goodText := fmt.Sprintf("%d", good)
-		if good > 0 {
-			goodText = fmt.Sprintf("%s%d%s", Green, good, Reset)
-		}
-		badText := fmt.Sprintf("%d", bad)
-		if bad > 0 {
-			badText = fmt.Sprintf("%s%d%s", Red, bad, Reset)
-		}
-		scanningText := fmt.Sprintf("%d", scanning)
-		if scanning > 0 {
-			scanningText = fmt.Sprintf("%s%d%s", Yellow, scanning, Reset)
+		badText := fmt.Sprintf("%d", es.Bad)
+		if es.Bad > 0 {
+			badText = fmt.Sprintf("%s%d%s", Red, es.Bad, Reset)
 		}
-
-		spaceUsedColor := Green
-		if es.AvgSpaceUsedPct >= 95 {
-			spaceUsedColor = Red
-		} else if es.AvgSpaceUsedPct >= 80 {
-			spaceUsedColor = Yellow
-		}
-		freeSpaceColor := Green
-		if es.AvgFreeSpacePct <= 5 {
-			freeSpaceColor = Red
-		} else if es.AvgFreeSpacePct <= 20 {
-			freeSpaceColor = Yellow
+		scanningText := fmt.Sprintf("%d", es.Scanning)
+		if es.Scanning > 0 {
+			scanningText = fmt.Sprintf("%s%d%s", Yellow, es.Scanning, Reset)
 		}
 
-		avgUsedInodes := int64(0)
-		avgFreeInodes := int64(0)
-		for _, d := range es.Drives {
-			avgUsedInodes += d.UsedInodes
-			avgFreeInodes += d.FreeInodes
-		}
-		avgTotalInodes := avgUsedInodes + avgFreeInodes
-		var avgInodesUsedPct float64
-		if avgTotalInodes > 0 {
-			avgInodesUsedPct = float64(avgUsedInodes) / float64(avgTotalInodes) * 100
-		}
-		inodesColor := Green
-		if avgInodesUsedPct >= 95 {
-			inodesColor = Red
-		} else if avgInodesUsedPct >= 80 {
-			inodesColor = Yellow
-		}
-
-		pager.Printf("  Pool %d, Erasure Set %d: Good disks: %s, Bad disks: %s, Scanning: %s, Avg Space Used: %s%.1f%%%s, Avg Free Space: %s%.1f%%%s, Avg Inodes Used: %s%.1f%%%s\n",
+		fmt.Fprintf(&out, "  Pool %d, Erasure Set %d: Good disks: %s, Bad disks: %s, Scanning: %s, Avg Space Used: %s, Avg Free Space: %s, Avg Inodes Used: %s\n",
 			es.PoolIdx, es.SetIdx, goodText, badText, scanningText,
-			spaceUsedColor, es.AvgSpaceUsedPct, Reset,
-			freeSpaceColor, es.AvgFreeSpacePct, Reset,
-			inodesColor, avgInodesUsedPct, Reset)
+			pctCell(usedPctColor(es.AvgSpaceUsedPct), es.AvgSpaceUsedPct),
+			pctCell(freePctColor(es.AvgFreeSpacePct), es.AvgFreeSpacePct),
+			pctCell(usedPctColor(es.AvgInodesUsedPct), es.AvgInodesUsedPct))
 	}
+	pager.WriteString(out.String())
 }
 
 // printServerInfo prints server metadata for all servers in table format
-func printServerInfo(pager *Pager, servers []madmin.ServerProperties, pools map[string]map[string]interface{}, trimDomain string) {
+func printServerInfo(pager *Pager, servers []madmin.ServerProperties, pools map[int]map[int]struct{}, trimDomain string) {
 	pager.Printf("%sServers%s\n", Bold, Reset)
 	
 	// Collect all unique servers and determine which pools each belongs to
@@ -1624,23 +1899,15 @@ func printServerInfo(pager *Pager, servers []madmin.ServerProperties, pools map[
 		pools   []int
 	})
 	
-	// Build map of valid pool indices from pools map
-	validPools := make(map[int]bool)
-	for poolKey := range pools {
-		if poolIdx, err := strconv.Atoi(poolKey); err == nil {
-			validPools[poolIdx] = true
-		}
-	}
-
 	// Build map of servers to their pool membership
 	for _, server := range servers {
 		endpointName := trimDomainData(server.Endpoint, trimDomain)
-		
+
 		// Collect all pools this server belongs to by checking its disks
-		// Only include pools that exist in the valid pools map
+		// Only include pools that exist in the pools map
 		poolSet := make(map[int]bool)
 		for _, disk := range server.Disks {
-			if validPools[disk.PoolIndex] {
+			if _, valid := pools[disk.PoolIndex]; valid {
 				poolSet[disk.PoolIndex] = true
 			}
 		}
@@ -1721,12 +1988,16 @@ func printServerInfo(pager *Pager, servers []madmin.ServerProperties, pools map[
 			poolStr = strings.Join(poolStrs, ",")
 		}
 
-		// Color code state
-		stateColor := Green
-		if server.State == "offline" {
-			stateColor = Red
+		// Color code state; the two common values are pre-rendered
+		var stateText string
+		switch server.State {
+		case "online":
+			stateText = serverOnlineCell
+		case "offline":
+			stateText = serverOfflineCell
+		default:
+			stateText = Green + server.State + Reset
 		}
-		stateText := fmt.Sprintf("%s%s%s", stateColor, server.State, Reset)
 
 		// Format commit ID (use full commit ID, no truncation)
 		commitID := server.CommitID
@@ -1758,58 +2029,12 @@ func printServerInfo(pager *Pager, servers []madmin.ServerProperties, pools map[
 		rows = append(rows, row)
 	}
 
-	// Calculate column widths
-	widths := make([]int, len(headers))
-	for i, h := range headers {
-		widths[i] = utf8.RuneCountInString(h)
-	}
-	for _, row := range rows {
-		for i, cell := range row {
-			// Strip ANSI codes for width calculation
-			cleanCell := stripANSI(cell)
-			if w := utf8.RuneCountInString(cleanCell); w > widths[i] {
-				widths[i] = w
-			}
-		}
-	}
-
-	// Print header
-	pager.Printf("  ")
-	for i, h := range headers {
-		pager.Printf("%s", padString(h, widths[i]))
-		if i < len(headers)-1 {
-			pager.Printf("  ")
-		}
-	}
-	pager.Printf("\n")
-
-	// Print separator
-	pager.Printf("  ")
-	for i, w := range widths {
-		pager.Printf("%s", strings.Repeat("-", w))
-		if i < len(widths)-1 {
-			pager.Printf("  ")
-		}
-	}
-	pager.Printf("\n")
-
-	// Print rows
-	for _, row := range rows {
-		pager.Printf("  ")
-		for i, cell := range row {
-			pager.Printf("%s", padString(cell, widths[i]))
-			if i < len(row)-1 {
-				pager.Printf("  ")
-			}
-		}
-		pager.Printf("\n")
-	}
+	renderTable(pager, headers, rows)
 	pager.Printf("\n")
 }
 
-func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, poolSetDrives map[string][]DiskInfo, allPoolSetDrives map[string][]DiskInfo, config *Config, servers []madmin.ServerProperties) {
-	// Collect all drives from all pools and erasure sets
-	allDrives := make([]DiskInfo, 0)
+func printPoolsAndSets(pager *Pager, pools map[int]map[int]struct{}, poolSetDrives map[poolSet][]DiskInfo, allPoolSetDrives map[poolSet][]DiskInfo, setStats map[poolSet]*setAggregate, config *Config, servers []madmin.ServerProperties) {
+	var allDrives []DiskInfo
 	
 	// For show sets, collect erasure set statistics and display in table format
 	if config.ShowSets {
@@ -1827,22 +2052,13 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 		erasureSetSummaries := make([]ErasureSetSummary, 0)
 		
 		for poolIdx, sets := range pools {
-			// Check if pool has failed disks (for failed mode) - use all drives for checking
+			// Check if pool has failed disks (for failed mode) - the
+			// per-set aggregates already carry the bad-disk counts
 			poolHasFailed := false
 			if config.FailedMode {
 				for setIdx := range sets {
-					key := fmt.Sprintf("%s:%s", poolIdx, setIdx)
-					drives := allPoolSetDrives[key]
-					if len(drives) == 0 {
-						drives = poolSetDrives[key] // Fallback
-					}
-					for _, d := range drives {
-						if d.State != "ok" {
-							poolHasFailed = true
-							break
-						}
-					}
-					if poolHasFailed {
+					if agg := setStats[poolSet{poolIdx, setIdx}]; agg != nil && agg.Bad > 0 {
+						poolHasFailed = true
 						break
 					}
 				}
@@ -1852,54 +2068,87 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 			}
 
 			for setIdx := range sets {
-				key := fmt.Sprintf("%s:%s", poolIdx, setIdx)
-				allDrivesForSet := poolSetDrives[key] // All drives (may be filtered by scanning/failed already)
-
-				// For summary mode with failed, we need ALL drives to count properly
-				// So we need to get them from allPoolSetDrives instead
-				var drivesForCounting []DiskInfo
-				if config.FailedMode {
-					// Get all drives from the original map for counting
-					allKey := fmt.Sprintf("%s:%s", poolIdx, setIdx)
-					drivesForCounting = allPoolSetDrives[allKey]
-					if len(drivesForCounting) == 0 {
-						// Fallback to poolSetDrives if not found
-						drivesForCounting = allDrivesForSet
+				key := poolSet{poolIdx, setIdx}
+
+				good := 0
+				bad := 0
+				scanning := 0
+				totalDrives := 0
+				sumTotalSpace := int64(0)
+				sumUsedSpace := int64(0)
+				sumFreeSpace := int64(0)
+				sumUsedInodes := int64(0)
+				sumFreeInodes := int64(0)
+
+				if !config.FailedMode && !config.ScanningMode {
+					// No per-drive filter active: the aggregates from the single
+					// pass over all drives already hold exactly these numbers.
+					agg := setStats[key]
+					if agg == nil || agg.Count == 0 {
+						continue
 					}
+					good = agg.Good
+					bad = agg.Bad
+					scanning = agg.Scanning
+					totalDrives = agg.Count
+					sumTotalSpace = agg.TotalSpace
+					sumUsedSpace = agg.UsedSpace
+					sumFreeSpace = agg.AvailSpace
+					sumUsedInodes = agg.UsedInodes
+					sumFreeInodes = agg.FreeInodes
 				} else {
-					drivesForCounting = allDrivesForSet
-				}
+					allDrivesForSet := poolSetDrives[key] // All drives (may be filtered by scanning/failed already)
 
-				if config.ScanningMode && len(allDrivesForSet) == 0 {
-					continue
-				}
-
-				// Filter to only failed disks in failed mode (for summary mode)
-				if config.FailedMode {
-					failedDrives := make([]DiskInfo, 0)
-					for _, d := range drivesForCounting {
-						if d.State != "ok" {
-							failedDrives = append(failedDrives, d)
-						}
-					}
-					if len(failedDrives) == 0 {
+					if config.ScanningMode && len(allDrivesForSet) == 0 {
 						continue
 					}
-					// For counting, use the filtered failed drives (to match Python behavior)
-					drivesForCounting = failedDrives
-				}
 
-				good := 0
-				bad := 0
-				scanning := 0
-				for _, d := range drivesForCounting {
-					if d.State == "ok" {
-						good++
+					// In failed-only mode the main pass already filtered
+					// poolSetDrives down to failed drives, so re-filtering the
+					// unfiltered list would just rebuild the same slice
+					if config.FailedMode && config.ScanningMode {
+						// Scanning filter doesn't apply here: count every failed
+						// drive from the unfiltered map (to match Python
+						// behavior), folding the filter into the counting scan
+						// instead of building an intermediate slice
+						all := allPoolSetDrives[key]
+						for i := range all {
+							d := &all[i]
+							if d.StateOK {
+								continue
+							}
+							bad++
+							if d.Scanning {
+								scanning++
+							}
+							sumTotalSpace += d.TotalSpace
+							sumUsedSpace += d.UsedSpace
+							sumFreeSpace += d.AvailableSpace
+							sumUsedInodes += d.UsedInodes
+							sumFreeInodes += d.FreeInodes
+							totalDrives++
+						}
 					} else {
-						bad++
+						for i := range allDrivesForSet {
+							d := &allDrivesForSet[i]
+							if d.StateOK {
+								good++
+							} else {
+								bad++
+							}
+							if d.Scanning {
+								scanning++
+							}
+							sumTotalSpace += d.TotalSpace
+							sumUsedSpace += d.UsedSpace
+							sumFreeSpace += d.AvailableSpace
+							sumUsedInodes += d.UsedInodes
+							sumFreeInodes += d.FreeInodes
+						}
+						totalDrives = len(allDrivesForSet)
 					}
-					if d.Scanning {
-						scanning++
+					if config.FailedMode && totalDrives == 0 {
+						continue
 					}
 				}
 
@@ -1911,20 +2160,12 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 				}
 
 				// Calculate averages - use all drives for averaging, not just filtered ones
-				totalDrives := len(drivesForCounting)
 				if totalDrives > 0 {
-					avgTotalSpace := int64(0)
-					avgUsedSpace := int64(0)
-					avgFreeSpace := int64(0)
-					avgUsedInodes := int64(0)
-					avgFreeInodes := int64(0)
-					for _, d := range drivesForCounting {
-						avgTotalSpace += d.TotalSpace
-						avgUsedSpace += d.UsedSpace
-						avgFreeSpace += d.AvailableSpace
-						avgUsedInodes += d.UsedInodes
-						avgFreeInodes += d.FreeInodes
-					}
+					avgTotalSpace := sumTotalSpace
+					avgUsedSpace := sumUsedSpace
+					avgFreeSpace := sumFreeSpace
+					avgUsedInodes := sumUsedInodes
+					avgFreeInodes := sumFreeInodes
 					avgTotalSpace /= int64(totalDrives)
 					avgUsedSpace /= int64(totalDrives)
 					avgFreeSpace /= int64(totalDrives)
@@ -1941,12 +2182,9 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 						avgInodesUsedPct = float64(avgUsedInodes) / float64(avgTotalInodes) * 100
 					}
 
-					poolIdxInt, _ := strconv.Atoi(poolIdx)
-					setIdxInt, _ := strconv.Atoi(setIdx)
-					
 					erasureSetSummaries = append(erasureSetSummaries, ErasureSetSummary{
-						PoolIndex:        poolIdxInt,
-						SetIndex:         setIdxInt,
+						PoolIndex:        poolIdx,
+						SetIndex:         setIdx,
 						GoodDisks:        good,
 						BadDisks:         bad,
 						ScanningDisks:    scanning,
@@ -1960,10 +2198,11 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 		
 		// Sort erasure sets by Pool and Erasure Set
 		sort.Slice(erasureSetSummaries, func(i, j int) bool {
-			if erasureSetSummaries[i].PoolIndex != erasureSetSummaries[j].PoolIndex {
-				return erasureSetSummaries[i].PoolIndex < erasureSetSummaries[j].PoolIndex
+			a, b := &erasureSetSummaries[i], &erasureSetSummaries[j]
+			if a.PoolIndex != b.PoolIndex {
+				return a.PoolIndex < b.PoolIndex
 			}
-			return erasureSetSummaries[i].SetIndex < erasureSetSummaries[j].SetIndex
+			return a.SetIndex < b.SetIndex
 		})
 		
 		// Print Erasure Sets table
@@ -1976,9 +2215,6 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 			for _, es := range erasureSetSummaries {
 				row := make([]string, len(headers))
 				
-				poolIdxStr := fmt.Sprintf("%d", es.PoolIndex)
-				setIdxStr := fmt.Sprintf("%d", es.SetIndex)
-				
 				goodText := fmt.Sprintf("%d", es.GoodDisks)
 				if es.GoodDisks > 0 {
 					goodText = fmt.Sprintf("%s%d%s", Green, es.GoodDisks, Reset)
@@ -1994,32 +2230,12 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 					scanningText = fmt.Sprintf("%s%d%s", Yellow, es.ScanningDisks, Reset)
 				}
 				
-				spaceUsedColor := Green
-				if es.AvgSpaceUsedPct >= 95 {
-					spaceUsedColor = Red
-				} else if es.AvgSpaceUsedPct >= 80 {
-					spaceUsedColor = Yellow
-				}
-				spaceUsedText := fmt.Sprintf("%s%.1f%%%s", spaceUsedColor, es.AvgSpaceUsedPct, Reset)
-				
-				freeSpaceColor := Green
-				if es.AvgFreeSpacePct <= 5 {
-					freeSpaceColor = Red
-				} else if es.AvgFreeSpacePct <= 20 {
-					freeSpaceColor = Yellow
-				}
-				freeSpaceText := fmt.Sprintf("%s%.1f%%%s", freeSpaceColor, es.AvgFreeSpacePct, Reset)
+				spaceUsedText := pctCell(usedPctColor(es.AvgSpaceUsedPct), es.AvgSpaceUsedPct)
+				freeSpaceText := pctCell(freePctColor(es.AvgFreeSpacePct), es.AvgFreeSpacePct)
+				inodesText := pctCell(usedPctColor(es.AvgInodesUsedPct), es.AvgInodesUsedPct)
 				
-				inodesColor := Green
-				if es.AvgInodesUsedPct >= 95 {
-					inodesColor = Red
-				} else if es.AvgInodesUsedPct >= 80 {
-					inodesColor = Yellow
-				}
-				inodesText := fmt.Sprintf("%s%.1f%%%s", inodesColor, es.AvgInodesUsedPct, Reset)
-				
-				row[0] = fmt.Sprintf("%s%s%s", Blue, poolIdxStr, Reset)
-				row[1] = fmt.Sprintf("%s%s%s", Blue, setIdxStr, Reset)
+				row[0] = blueIndexCell(es.PoolIndex)
+				row[1] = blueIndexCell(es.SetIndex)
 				row[2] = goodText
 				row[3] = badText
 				row[4] = scanningText
@@ -2030,57 +2246,19 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 				rows = append(rows, row)
 			}
 			
-			// Calculate column widths
-			widths := make([]int, len(headers))
-			for i, h := range headers {
-				widths[i] = utf8.RuneCountInString(h)
-			}
-			for _, row := range rows {
-				for i, cell := range row {
-					cleanCell := stripANSI(cell)
-					if w := utf8.RuneCountInString(cleanCell); w > widths[i] {
-						widths[i] = w
-					}
-				}
-			}
-			
-			// Print header
-			pager.Printf("  ")
-			for i, h := range headers {
-				pager.Printf("%s", padString(h, widths[i]))
-				if i < len(headers)-1 {
-					pager.Printf("  ")
-				}
-			}
-			pager.Printf("\n")
-			
-			// Print separator
-			pager.Printf("  ")
-			for i, w := range widths {
-				pager.Printf("%s", strings.Repeat("-", w))
-				if i < len(widths)-1 {
-					pager.Printf("  ")
-				}
-			}
-			pager.Printf("\n")
-			
-			// Print rows with spacing
-			for _, row := range rows {
-				pager.Printf("  ")
-				for i, cell := range row {
-					pager.Printf("%s", padString(cell, widths[i]))
-					if i < len(row)-1 {
-						pager.Printf("  ")
-					}
-				}
-				pager.Printf("\n")
-			}
+			renderTable(pager, headers, rows)
 			pager.Printf("\n")
 		}
 	}
 
-	// Collect all drives for the table (for show disks mode)
+	// Collect all drives for the table (for show disks mode), sized up
+	// front so the flatten doesn't reallocate as it grows
 	if config.ShowDisks {
+		total := 0
+		for _, drives := range poolSetDrives {
+			total += len(drives)
+		}
+		allDrives = make([]DiskInfo, 0, total)
 		for _, drives := range poolSetDrives {
 			allDrives = append(allDrives, drives...)
 		}
@@ -2093,38 +2271,87 @@ func printPoolsAndSets(pager *Pager, pools map[string]map[string]interface{}, po
 
 	// Sort all drives by Pool, Erasure Set, Disk Index
 	sort.Slice(allDrives, func(i, j int) bool {
-		if allDrives[i].PoolIndex != allDrives[j].PoolIndex {
-			return allDrives[i].PoolIndex < allDrives[j].PoolIndex
-		}
-		if allDrives[i].SetIndex != allDrives[j].SetIndex {
-			return allDrives[i].SetIndex < allDrives[j].SetIndex
-		}
-		// Compare DiskIndex - handle interface{} type
-		diStr := fmt.Sprintf("%v", allDrives[i].DiskIndex)
-		djStr := fmt.Sprintf("%v", allDrives[j].DiskIndex)
-		// Try numeric comparison first
-		if di, err1 := strconv.Atoi(diStr); err1 == nil {
-			if dj, err2 := strconv.Atoi(djStr); err2 == nil {
-				return di < dj
-			}
+		a, b := &allDrives[i], &allDrives[j]
+		if a.PoolIndex != b.PoolIndex {
+			return a.PoolIndex < b.PoolIndex
 		}
-		return diStr < djStr
+		if a.SetIndex != b.SetIndex {
+			return a.SetIndex < b.SetIndex
+		}
+		return a.DiskIndex < b.DiskIndex
 	})
 
 	// Print single table with all drives
 	if len(allDrives) > 0 {
-		// Only print "Drives" header if ShowDisks is true and not already showing sets
-	if config.ShowDisks && !config.ShowSets {
-		pager.Printf("%sDrives%s\n", Bold, Reset)
-	} else if config.ShowDisks && config.ShowSets {
-		// When both ShowDisks and ShowSets are true, we don't need a separate header
+		// ShowDisks is guaranteed here (the function returned above
+		// otherwise), and the header reads the same with or without the
+		// sets table, so the old per-mode branches collapsed to one print
 		pager.Printf("%sDrives%s\n", Bold, Reset)
-	}
 		printTable(pager, allDrives, config)
 		pager.Printf("\n")
 	}
 }
 
+// renderTable emits a fixed-width table (two-space indent and column gap)
+// shared by the drive, erasure-set and server views: compute visible column
+// widths once, then assemble header, separator and rows in one buffer
+func renderTable(pager *Pager, headers []string, rows [][]string) {
+	widths := make([]int, len(headers))
+	for i, h := range headers {
+		widths[i] = utf8.RuneCountInString(h)
+	}
+	// Measure the visible width of every cell exactly once; padding via
+	// padString would strip the ANSI codes a second time per cell
+	cellWidths := make([][]int, len(rows))
+	for r, row := range rows {
+		cw := make([]int, len(row))
+		for i, cell := range row {
+			w := utf8.RuneCountInString(stripANSI(cell))
+			cw[i] = w
+			if w > widths[i] {
+				widths[i] = w
+			}
+		}
+		cellWidths[r] = cw
+	}
+
+	var table strings.Builder
+	table.Grow((len(rows) + 2) * 128)
+
+	table.WriteString("  ")
+	for i, h := range headers {
+		table.WriteString(padString(h, widths[i]))
+		if i < len(headers)-1 {
+			table.WriteString("  ")
+		}
+	}
+	table.WriteString("\n")
+
+	table.WriteString("  ")
+	for i, w := range widths {
+		table.WriteString(strings.Repeat("-", w))
+		if i < len(widths)-1 {
+			table.WriteString("  ")
+		}
+	}
+	table.WriteString("\n")
+
+	for r, row := range rows {
+		table.WriteString("  ")
+		for i, cell := range row {
+			table.WriteString(cell)
+			if pad := widths[i] - cellWidths[r][i]; pad > 0 {
+				table.WriteString(strings.Repeat(" ", pad))
+			}
+			if i < len(row)-1 {
+				table.WriteString("  ")
+			}
+		}
+		table.WriteString("\n")
+	}
+	pager.WriteString(table.String())
+}
+
 func printTable(pager *Pager, drives []DiskInfo, config *Config) {
 	if len(drives) == 0 {
 		return
@@ -2132,56 +2359,39 @@ func printTable(pager *Pager, drives []DiskInfo, config *Config) {
 
 	headers := []string{"Pool", "Erasure Set", "Disk Index", "Server", "Disk Path", "State", "Scanning", "UUID", "Total Space", "Space Used", "Free Space", "Inodes Used", "Local", "Metrics"}
 
+	// One backing array for every row's cells instead of a fresh slice
+	// allocation per drive
 	rows := make([][]string, 0, len(drives))
-	for _, drive := range drives {
-		row := make([]string, len(headers))
-
-		poolIdxStr := fmt.Sprintf("%d", drive.PoolIndex)
-		setIdxStr := fmt.Sprintf("%d", drive.SetIndex)
-		diskIdxStr := fmt.Sprintf("%v", drive.DiskIndex)
+	cells := make([]string, len(headers)*len(drives))
+	for di := range drives {
+		drive := &drives[di]
+		row := cells[di*len(headers) : (di+1)*len(headers)]
 
-		serverParts := strings.Split(drive.Server, ".")
-		serverName := serverParts[0]
+		diskIdxStr := strconv.Itoa(drive.DiskIndex)
 
-		stateColor := Green
-		if drive.State != "ok" {
-			stateColor = Red
-		}
-		stateText := fmt.Sprintf("%s%s%s", stateColor, drive.State, Reset)
+		// Only the first label is displayed; Cut stops at the first dot
+		// instead of allocating a slice of every component
+		serverName, _, _ := strings.Cut(drive.Server, ".")
 
-		scanningColor := Yellow
-		if !drive.Scanning {
-			scanningColor = Green
+		stateText := stateOkCell
+		if !drive.StateOK {
+			stateText = Red + drive.State + Reset
 		}
-		scanningText := fmt.Sprintf("%s%s%s", scanningColor, boolToYesNo(drive.Scanning), Reset)
 
-		uuid := drive.UUID
-		if len(uuid) > 16 {
-			uuid = uuid[:16] + "..."
+		scanningText := scanningNoCell
+		if drive.Scanning {
+			scanningText = scanningYesCell
 		}
 
 		var totalSpaceStr, spaceUsedStr, freeSpaceStr string
 		if drive.TotalSpace > 0 {
-			totalGB := float64(drive.TotalSpace) / (1024 * 1024 * 1024)
-			usedGB := float64(drive.UsedSpace) / (1024 * 1024 * 1024)
-			freeGB := float64(drive.AvailableSpace) / (1024 * 1024 * 1024)
-
-			usageColor := Green
-			if drive.UsedSpacePct >= 95 {
-				usageColor = Red
-			} else if drive.UsedSpacePct >= 80 {
-				usageColor = Yellow
-			}
-			freeColor := Green
-			if drive.FreeSpacePct <= 5 {
-				freeColor = Red
-			} else if drive.FreeSpacePct <= 20 {
-				freeColor = Yellow
-			}
+			totalGB := float64(drive.TotalSpace) / float64(GiB)
+			usedGB := float64(drive.UsedSpace) / float64(GiB)
+			freeGB := float64(drive.AvailableSpace) / float64(GiB)
 
 			totalSpaceStr = fmt.Sprintf("%.1fGB", totalGB)
-			spaceUsedStr = fmt.Sprintf("%.1fGB (%s%.1f%%%s)", usedGB, usageColor, drive.UsedSpacePct, Reset)
-			freeSpaceStr = fmt.Sprintf("%.1fGB (%s%.1f%%%s)", freeGB, freeColor, drive.FreeSpacePct, Reset)
+			spaceUsedStr = fmt.Sprintf("%.1fGB (%s)", usedGB, pctCell(usedPctColor(drive.UsedSpacePct), drive.UsedSpacePct))
+			freeSpaceStr = fmt.Sprintf("%.1fGB (%s)", freeGB, pctCell(freePctColor(drive.FreeSpacePct), drive.FreeSpacePct))
 		} else {
 			totalSpaceStr = "N/A"
 			spaceUsedStr = "N/A"
@@ -2192,33 +2402,26 @@ func printTable(pager *Pager, drives []DiskInfo, config *Config) {
 		if drive.UsedInodes > 0 {
 			totalInodes := drive.UsedInodes + drive.FreeInodes
 			inodePct := float64(drive.UsedInodes) / float64(totalInodes) * 100
-			inodeColor := Green
-			if inodePct >= 95 {
-				inodeColor = Red
-			} else if inodePct >= 80 {
-				inodeColor = Yellow
-			}
-			inodeStr = fmt.Sprintf("%s (%s%.1f%%%s)", formatInt(drive.UsedInodes), inodeColor, inodePct, Reset)
+			inodeStr = fmt.Sprintf("%s (%s)", formatInt(drive.UsedInodes), pctCell(usedPctColor(inodePct), inodePct))
 		} else {
 			inodeStr = "N/A"
 		}
 
-		localColor := Green
-		if !drive.Local {
-			localColor = Yellow
+		localText := localNoCell
+		if drive.Local {
+			localText = localYesCell
 		}
-		localText := fmt.Sprintf("%s%s%s", localColor, boolToYesNo(drive.Local), Reset)
 
 		metricsStr := formatMetrics(drive.Metrics)
 
-		row[0] = fmt.Sprintf("%s%s%s", Blue, poolIdxStr, Reset)
-		row[1] = fmt.Sprintf("%s%s%s", Blue, setIdxStr, Reset)
+		row[0] = blueIndexCell(drive.PoolIndex)
+		row[1] = blueIndexCell(drive.SetIndex)
 		row[2] = diskIdxStr
 		row[3] = serverName
 		row[4] = drive.Path
 		row[5] = stateText
 		row[6] = scanningText
-		row[7] = uuid
+		row[7] = drive.UUID
 		row[8] = totalSpaceStr
 		row[9] = spaceUsedStr
 		row[10] = freeSpaceStr
@@ -2229,55 +2432,33 @@ func printTable(pager *Pager, drives []DiskInfo, config *Config) {
 		rows = append(rows, row)
 	}
 
-	// Calculate column widths
-	widths := make([]int, len(headers))
-	for i, h := range headers {
-		widths[i] = utf8.RuneCountInString(h)
-	}
-	for _, row := range rows {
-		for i, cell := range row {
-			// Strip ANSI codes for width calculation
-			cleanCell := stripANSI(cell)
-			if w := utf8.RuneCountInString(cleanCell); w > widths[i] {
-				widths[i] = w
-			}
-		}
-	}
-
-	// Print header
-	pager.Printf("  ")
-	for i, h := range headers {
-		pager.Printf("%s", padString(h, widths[i]))
-		if i < len(headers)-1 {
-			pager.Printf("  ")
-		}
-	}
-	pager.Printf("\n")
-
-	// Print separator
-	pager.Printf("  ")
-	for i, w := range widths {
-		pager.Printf("%s", strings.Repeat("-", w))
-		if i < len(widths)-1 {
-			pager.Printf("  ")
-		}
-	}
-	pager.Printf("\n")
+	renderTable(pager, headers, rows)
+}
 
-	// Print rows
-	for _, row := range rows {
-		pager.Printf("  ")
-		for i, cell := range row {
-			pager.Printf("%s", padString(cell, widths[i]))
-			if i < len(row)-1 {
-				pager.Printf("  ")
-			}
+// diskIndexValue normalizes the disk index reported by madmin to an int
+// once at load time; non-numeric values sort last
+func diskIndexValue(v interface{}) int {
+	switch n := v.(type) {
+	case int:
+		return n
+	case int64:
+		return int(n)
+	case float64:
+		return int(n)
+	case string:
+		if i, err := strconv.Atoi(n); err == nil {
+			return i
 		}
-		pager.Printf("\n")
 	}
+	return math.MaxInt32
 }
 
 func stripANSI(s string) string {
+	// Most cells carry no escape codes at all (and none do when colors are
+	// disabled for non-TTY output); skip the rune walk and rebuild entirely
+	if !strings.ContainsRune(s, '\033') {
+		return s
+	}
 	var result strings.Builder
 	inANSI := false
 	for _, r := range s {
@@ -2306,13 +2487,6 @@ func padString(s string, width int) string {
 	return s + strings.Repeat(" ", padding)
 }
 
-func boolToYesNo(b bool) string {
-	if b {
-		return "Yes"
-	}
-	return "No"
-}
-
 // naturalLess compares two strings using natural/alphanumeric sorting
 // This ensures that "rack2" comes before "rack10"
 func naturalLess(a, b string) bool {
@@ -2397,8 +2571,23 @@ func formatInt(n int64) string {
 	return result.String()
 }
 
+// trimDomainCache memoizes trimDomainData results; the same server endpoint
+// is normalized once per view, and URL parsing plus host/IP checks are not
+// free. The tool is single-threaded, so a plain map is fine.
+var trimDomainCache = make(map[string]string)
+
 // trimDomainData trims domain suffix from endpoint for cleaner display
 func trimDomainData(endpoint, domainString string) string {
+	cacheKey := endpoint + "\x00" + domainString
+	if cached, ok := trimDomainCache[cacheKey]; ok {
+		return cached
+	}
+	result := trimDomainDataUncached(endpoint, domainString)
+	trimDomainCache[cacheKey] = result
+	return result
+}
+
+func trimDomainDataUncached(endpoint, domainString string) string {
 	// Normalize endpoint to extract host (remove scheme, path and port)
 	host := endpoint
 